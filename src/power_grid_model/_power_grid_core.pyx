@@ -619,16 +619,24 @@ def initialize_array(data_type: str, component_type: str, shape: Union[tuple, in
     """
     if not isinstance(shape, tuple):
         shape = (shape, )
+    # the prebuilt one-element 'nan_scalar' template is broadcast over the new array in a single C-level copy
+    meta_data = _power_grid_meta_data[data_type][component_type]
     return np.full(
         shape=shape,
-        fill_value=_power_grid_meta_data[data_type][component_type]['nan_scalar'],
-        dtype=_power_grid_meta_data[data_type][component_type]['dtype'],
+        fill_value=meta_data['nan_scalar'],
+        dtype=meta_data['dtype'],
         order='C'
     )
 
 
-# external used meta data
-power_grid_meta_data = _generate_meta_data()
+# external used meta data; a nested copy of the internal dicts, so external modification of the structure cannot
+# break the internals, while the leaf objects (notably the dtypes) are shared. Arrays created through
+# initialize_array() therefore reference the exact dtype objects found in power_grid_meta_data, which allows
+# validation to compare dtypes by identity.
+power_grid_meta_data = {
+    data_type: {component: dict(meta) for component, meta in components.items()}
+    for data_type, components in _power_grid_meta_data.items()
+}
 
 # has mkl flag
 use_mkl_solver = has_mkl()
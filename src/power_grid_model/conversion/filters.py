@@ -0,0 +1,375 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""
+These functions can be used to convert arbitrary source data (e.g. a spreadsheet export) into values that are valid
+in the power-grid-model domain. E.g. get_winding_from("Dyn11") yields WindingType.delta.
+"""
+import math
+import sys
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..enum import WindingType
+
+try:
+    # numba is an optional dependency; when it is available the scalar hot helpers below are compiled
+    import numba
+except ImportError:
+    numba = None
+
+_WINDINGS_FROM = frozenset(("Y", "YN", "D", "Z", "ZN"))
+_WINDINGS_TO = frozenset(("y", "yn", "d", "z", "zn"))
+_CLOCKS = {str(clock): clock for clock in range(13)}
+
+# Enum attribute access goes through a descriptor chain, so the members are resolved once at import time
+_WYE = WindingType.wye
+_WYE_N = WindingType.wye_n
+_DELTA = WindingType.delta
+_ZIGZAG = WindingType.zigzag
+_ZIGZAG_N = WindingType.zigzag_n
+
+WINDING_TYPES = {
+    "Y": _WYE,
+    "YN": _WYE_N,
+    "D": _DELTA,
+    "Z": _ZIGZAG,
+    "ZN": _ZIGZAG_N,
+}
+
+
+@lru_cache(maxsize=128)
+def _split_connection_string(conn_str: str) -> Tuple[str, str, int]:
+    """
+    Split a transformer connection string into the winding from, the winding to and the clock number.
+    E.g. "Dyn11" -> ("D", "yn", 11). A typical dataset repeats the same few connection strings for every
+    transformer, so the parse results are cached; each distinct string is parsed only once.
+
+    Args:
+        conn_str: The connection string, e.g. "Dyn11"
+
+    Returns: A tuple containing the winding from, the winding to and the clock number
+
+    """
+    # The grammar is tiny and deterministic: an upper case winding, a lower case winding and a clock number.
+    # Splitting on the case boundaries and validating by set membership is much cheaper than a regular expression.
+    pos = 0
+    while pos < len(conn_str) and conn_str[pos].isupper():
+        pos += 1
+    end = pos
+    while end < len(conn_str) and conn_str[end].islower():
+        end += 1
+    winding_from = conn_str[:pos]
+    winding_to = conn_str[pos:end]
+    clock = _CLOCKS.get(conn_str[end:])
+    if winding_from not in _WINDINGS_FROM or winding_to not in _WINDINGS_TO or clock is None:
+        raise ValueError(f"Invalid transformer connection string: '{conn_str}'")
+    return winding_from, winding_to, clock
+
+
+def _resolve_winding(winding: str, neutral_grounding: bool) -> WindingType:
+    winding_type = WINDING_TYPES[winding.upper()]
+    if not neutral_grounding:
+        if winding_type == _WYE_N:
+            return _WYE
+        if winding_type == _ZIGZAG_N:
+            return _ZIGZAG
+    return winding_type
+
+
+# Precomputed lookup table covering all (winding, neutral_grounding) combinations, in both the upper case
+# (from side) and lower case (to side) spelling. Resolving a winding type at conversion time is then a single
+# dict lookup instead of an upper(), a dict lookup and enum comparisons.
+_WINDING_LUT = {
+    (winding, neutral_grounding): _resolve_winding(winding, neutral_grounding)
+    for winding in [*WINDING_TYPES, *(winding.lower() for winding in WINDING_TYPES)]
+    for neutral_grounding in (True, False)
+}
+
+
+def _get_winding(winding: str, neutral_grounding: bool) -> WindingType:
+    return _WINDING_LUT[(winding, neutral_grounding)]
+
+
+@lru_cache(maxsize=256)
+def get_winding_from(conn_str: str, neutral_grounding: bool = True) -> WindingType:
+    """
+    Get the winding type, closest to the 'from' node, from a connection string.
+    E.g. get_winding_from("Dyn11") -> WindingType.delta
+
+    Args:
+        conn_str: The connection string, e.g. "Dyn11"
+        neutral_grounding: Is the neutral grounded (only applicable to wye_n and zigzag_n windings)
+
+    Returns: The winding type on the from side of the transformer
+
+    """
+    winding_from, _, _ = _split_connection_string(conn_str)
+    return _get_winding(winding_from, neutral_grounding)
+
+
+@lru_cache(maxsize=256)
+def get_winding_to(conn_str: str, neutral_grounding: bool = True) -> WindingType:
+    """
+    Get the winding type, closest to the 'to' node, from a connection string.
+    E.g. get_winding_to("Dyn11") -> WindingType.wye_n
+
+    Args:
+        conn_str: The connection string, e.g. "Dyn11"
+        neutral_grounding: Is the neutral grounded (only applicable to wye_n and zigzag_n windings)
+
+    Returns: The winding type on the to side of the transformer
+
+    """
+    _, winding_to, _ = _split_connection_string(conn_str)
+    return _get_winding(winding_to, neutral_grounding)
+
+
+@lru_cache(maxsize=256)
+def get_clock(conn_str: str) -> int:
+    """
+    Extract the clock number from a connection string.
+    E.g. get_clock("Dyn11") -> 11
+
+    Args:
+        conn_str: The connection string, e.g. "Dyn11"
+
+    Returns: The clock number (0-12)
+
+    """
+    _, _, clock = _split_connection_string(conn_str)
+    return clock
+
+
+def _get_windings_array(conn_str: np.ndarray, neutral_grounding, winding_fn) -> np.ndarray:
+    """
+    Resolve the winding type for a whole column of connection strings at once. Each distinct connection string is
+    parsed only once; the result is then gathered back to the original shape through the inverse index.
+    """
+    conn_str = np.asarray(conn_str)
+    unique, inverse = np.unique(conn_str, return_inverse=True)
+    # interned strings share one object per distinct value, so the lru_cache on the scalar helpers can hash
+    # and compare the keys by identity on every batch after the first
+    unique = [sys.intern(str(s)) for s in unique]
+    grounded = np.array([winding_fn(s, True) for s in unique], dtype=np.int8)
+    ungrounded = np.array([winding_fn(s, False) for s in unique], dtype=np.int8)
+    return np.where(neutral_grounding, grounded[inverse], ungrounded[inverse])
+
+
+def get_winding_from_array(conn_str: np.ndarray, neutral_grounding=True) -> np.ndarray:
+    """
+    Vectorized version of get_winding_from(), to be used on whole transformer columns at once.
+
+    Args:
+        conn_str: An array of connection strings, e.g. ["Dyn11", "Yzn5", ...]
+        neutral_grounding: Is the neutral grounded; either a single boolean or an array matching conn_str
+
+    Returns: An int8 array of WindingType values for the from side of each transformer
+
+    """
+    return _get_windings_array(conn_str, neutral_grounding, get_winding_from)
+
+
+def get_winding_to_array(conn_str: np.ndarray, neutral_grounding=True) -> np.ndarray:
+    """
+    Vectorized version of get_winding_to(), to be used on whole transformer columns at once.
+
+    Args:
+        conn_str: An array of connection strings, e.g. ["Dyn11", "Yzn5", ...]
+        neutral_grounding: Is the neutral grounded; either a single boolean or an array matching conn_str
+
+    Returns: An int8 array of WindingType values for the to side of each transformer
+
+    """
+    return _get_windings_array(conn_str, neutral_grounding, get_winding_to)
+
+
+def get_clock_array(conn_str: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of get_clock(), to be used on whole transformer columns at once.
+
+    Args:
+        conn_str: An array of connection strings, e.g. ["Dyn11", "Yzn5", ...]
+
+    Returns: An int8 array of clock numbers (0-12)
+
+    """
+    conn_str = np.asarray(conn_str)
+    unique, inverse = np.unique(conn_str, return_inverse=True)
+    clocks = np.array([get_clock(sys.intern(str(s))) for s in unique], dtype=np.int8)
+    return clocks[inverse]
+
+
+def multiply(*args: float) -> float:
+    """
+    Multiply all arguments, e.g. to apply a unit scaling to a value.
+    """
+    return math.prod(args)
+
+
+def multiply_columns(*columns: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of multiply(), multiplying any number of columns elementwise in one pass.
+
+    Args:
+        *columns: Two or more arrays of equal (or broadcastable) shape
+
+    Returns: A float64 array containing the elementwise product of all columns
+
+    """
+    product = np.array(columns[0], dtype=np.float64)
+    for column in columns[1:]:
+        product *= column
+    return product
+
+
+def value_or_default(value: Optional[float], default: float) -> float:
+    """
+    Return the value, or a default value if no value (None or NaN) was supplied.
+    """
+    if value is None:
+        return default
+    if isinstance(value, float):
+        # math.isnan is much cheaper than the np.isnan ufunc for a single Python float
+        return default if math.isnan(value) else value
+    return default if np.isnan(value) else value
+
+
+def values_or_default(values: np.ndarray, default: float) -> np.ndarray:
+    """
+    Vectorized version of value_or_default(), replacing all NaN values in a whole column at once.
+
+    Args:
+        values: An array of values, possibly containing NaN values
+        default: The value to use where no value was supplied
+
+    Returns: A float64 array in which all NaN values are replaced by the default value
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), default, values)
+
+
+def value_or_zero(value: Optional[float]) -> float:
+    """
+    Return the value, or zero if no value (None or NaN) was supplied.
+    """
+    return value_or_default(value=value, default=0.0)
+
+
+def complex_inverse_real_part(real: float, imag: float) -> float:
+    """
+    Return the real part of the inverse of a complex number, e.g. to convert impedance into admittance.
+
+    Args:
+        real: The real part of the complex number
+        imag: The imaginary part of the complex number
+
+    Returns: The real part of the inverse of the complex number
+
+    """
+    # 1 / (a + bj) = (a - bj) / (a^2 + b^2); the closed form avoids constructing a complex object
+    return real / (real * real + imag * imag)
+
+
+def complex_inverse_imaginary_part(real: float, imag: float) -> float:
+    """
+    Return the imaginary part of the inverse of a complex number, e.g. to convert impedance into admittance.
+
+    Args:
+        real: The real part of the complex number
+        imag: The imaginary part of the complex number
+
+    Returns: The imaginary part of the inverse of the complex number
+
+    """
+    return -imag / (real * real + imag * imag)
+
+
+def complex_inverse_real_part_array(real: np.ndarray, imag: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of complex_inverse_real_part(), to be used on whole columns at once.
+
+    Args:
+        real: An array of real parts
+        imag: An array of imaginary parts
+
+    Returns: A float64 array with the real parts of the inverses of the complex numbers
+
+    """
+    real = np.asarray(real, dtype=np.float64)
+    imag = np.asarray(imag, dtype=np.float64)
+    return real / (real * real + imag * imag)
+
+
+def complex_inverse_imaginary_part_array(real: np.ndarray, imag: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of complex_inverse_imaginary_part(), to be used on whole columns at once.
+
+    Args:
+        real: An array of real parts
+        imag: An array of imaginary parts
+
+    Returns: A float64 array with the imaginary parts of the inverses of the complex numbers
+
+    """
+    real = np.asarray(real, dtype=np.float64)
+    imag = np.asarray(imag, dtype=np.float64)
+    return -imag / (real * real + imag * imag)
+
+
+def relative_no_load_current(i_0: float, p_0: float, s_nom: float, u_nom: float) -> float:
+    """
+    Calculate the relative no load current of a transformer. The no load current may be supplied as an absolute
+    current (in A), or as a no load loss (in W); the highest relative value is used.
+
+    Args:
+        i_0: The no load current (A)
+        p_0: The no load loss (W)
+        s_nom: The nominal power of the transformer (VA)
+        u_nom: The nominal voltage of the transformer (V)
+
+    Returns: The relative no load current (0-1)
+
+    """
+    i_rel = max(i_0 / (s_nom / u_nom / math.sqrt(3.0)), p_0 / s_nom)
+    if i_rel > 1.0:
+        # a constant message (no f-string), so this function stays compilable in numba nopython mode
+        raise ValueError("Relative no load current can't be more than 100%")
+    return i_rel
+
+
+def relative_no_load_current_array(
+    i_0: np.ndarray, p_0: np.ndarray, s_nom: np.ndarray, u_nom: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized version of relative_no_load_current(), to be used on whole transformer columns at once.
+
+    Args:
+        i_0: An array of no load currents (A)
+        p_0: An array of no load losses (W)
+        s_nom: An array of nominal transformer powers (VA)
+        u_nom: An array of nominal transformer voltages (V)
+
+    Returns: A float64 array of relative no load currents (0-1)
+
+    """
+    i_0 = np.asarray(i_0, dtype=np.float64)
+    p_0 = np.asarray(p_0, dtype=np.float64)
+    s_nom = np.asarray(s_nom, dtype=np.float64)
+    u_nom = np.asarray(u_nom, dtype=np.float64)
+    i_rel = np.fmax(i_0 / (s_nom / u_nom / np.sqrt(3.0)), p_0 / s_nom)
+    if np.any(i_rel > 1.0):
+        raise ValueError(f"Relative no load current can't be more than 100% (got {np.max(i_rel):.1%})")
+    return i_rel
+
+
+if numba is not None:
+    # compile the scalar arithmetic helpers, which are called once per row in bulk conversion loops;
+    # the pure Python definitions above are used as-is when numba is not installed
+    relative_no_load_current = numba.njit(cache=True)(relative_no_load_current)
+    complex_inverse_real_part = numba.njit(cache=True)(complex_inverse_real_part)
+    complex_inverse_imaginary_part = numba.njit(cache=True)(complex_inverse_imaginary_part)
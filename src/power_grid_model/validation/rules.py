@@ -374,20 +374,39 @@ def all_cross_unique(
         A list containing zero or one MultiComponentNotUniqueError, listing all fields and ids where the value was not
         unique between the fields.
     """
-    all_values = {}
-    duplicate_ids = set()
-    for component, field in fields:
-        for obj_id, value in zip(data[component]["id"], data[component][field]):
-            component_id = ((component, field), obj_id)
-            if value not in all_values:
-                all_values[value] = []
-            elif not cross_only or not all(f == (component, field) for f, _ in all_values[value]):
-                duplicate_ids.update(all_values[value])
-                duplicate_ids.add(component_id)
-            all_values[value].append(component_id)
-    if duplicate_ids:
-        fields_with_duplicated_ids = {f for f, _ in duplicate_ids}
-        ids_with_duplicated_ids = {(c, i) for (c, _), i in duplicate_ids}
+    if not fields:
+        return []
+    # Mask out missing values per field; np.unique would collapse all NaN values into a single duplicated value,
+    # while a missing value should never be reported as a duplicate of another missing value.
+    value_arrays = []
+    id_arrays = []
+    index_arrays = []
+    for index, (component, field) in enumerate(fields):
+        field_values = data[component][field]
+        nan = nan_type(component, field)
+        if np.isnan(nan):
+            mask = ~np.isnan(field_values)
+        else:
+            mask = np.not_equal(field_values, nan)
+        value_arrays.append(field_values[mask])
+        id_arrays.append(data[component]["id"][mask])
+        index_arrays.append(np.full(len(id_arrays[-1]), index))
+    values = np.concatenate(value_arrays)
+    obj_ids = np.concatenate(id_arrays)
+    field_idx = np.concatenate(index_arrays)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    duplicates = counts[inverse] > 1
+    if cross_only:
+        # Count the number of distinct fields each value occurs in; a value that is only duplicated within a
+        # single field is not a cross duplicate.
+        value_field_pairs = np.unique(inverse * len(fields) + field_idx)
+        n_fields = np.bincount(value_field_pairs // len(fields), minlength=len(counts))
+        duplicates &= n_fields[inverse] > 1
+    if duplicates.any():
+        fields_with_duplicated_ids = {fields[i] for i in field_idx[duplicates]}
+        ids_with_duplicated_ids = {
+            (fields[i][0], obj_id) for i, obj_id in zip(field_idx[duplicates], obj_ids[duplicates])
+        }
         return [MultiComponentNotUniqueError(list(fields_with_duplicated_ids), list(ids_with_duplicated_ids))]
     return []
 
@@ -440,8 +459,8 @@ def all_valid_ids(
     if isinstance(ref_components, str):
         ref_components = [ref_components]
 
-    # Create a set of ids by chaining the ids of all ref_components
-    valid_ids = set()
+    # Create an array of ids by concatenating the (non-nan) ids of all ref_components
+    id_arrays = []
     for ref_component in ref_components:
         if ref_component in data:
             nan = nan_type(ref_component, "id")
@@ -449,7 +468,8 @@ def all_valid_ids(
                 mask = ~np.isnan(data[ref_component]["id"])
             else:
                 mask = np.not_equal(data[ref_component]["id"], nan)
-            valid_ids.update(data[ref_component]["id"][mask])
+            id_arrays.append(data[ref_component]["id"][mask])
+    valid_ids = np.concatenate(id_arrays) if id_arrays else np.empty(0, dtype=np.int32)
 
     # Apply the filters (e.g. to select only records with a certain MeasuredTerminalType)
     values = data[component][field]
@@ -457,8 +477,8 @@ def all_valid_ids(
     for filter_field, filter_value in filters.items():
         mask = np.logical_and(mask, data[component][filter_field] == filter_value)
 
-    # Find any values that can't be found in the set of ids
-    invalid = np.logical_and(mask, np.isin(values, list(valid_ids), invert=True))
+    # Find any values that can't be found in the array of valid ids
+    invalid = np.logical_and(mask, np.isin(values, valid_ids, invert=True))
     if invalid.any():
         ids = data[component]["id"][invalid].flatten().tolist()
         return [InvalidIdError(component, field, ids, ref_components, filters)]
@@ -602,16 +622,17 @@ def none_missing(data: Dict[str, np.ndarray], component: str, fields: Union[str,
     errors = []
     if isinstance(fields, str):
         fields = [fields]
+    array = data[component]
     for field in fields:
         nan = nan_type(component, field)
         if np.isnan(nan):
-            invalid = np.isnan(data[component][field])
+            invalid = np.isnan(array[field])
         else:
-            invalid = np.equal(data[component][field], nan)
+            invalid = np.equal(array[field], nan)
         if invalid.any():
             if invalid.ndim > 1:
                 invalid = invalid.any(axis=1)
-            ids = data[component]["id"][invalid].flatten().tolist()
+            ids = array["id"][invalid].flatten().tolist()
             errors.append(MissingValueError(component, field, ids))
     return errors
 
@@ -18,6 +18,19 @@ InputData = Dict[str, np.ndarray]
 UpdateData = Dict[str, Union[np.ndarray, Dict[str, np.ndarray]]]
 BatchData = List[Dict[str, np.ndarray]]
 
+# The field expression pattern is compiled once; the bound fullmatch saves an attribute lookup per call.
+_field_expression_match = re.compile(r"[a-z][a-z0-9_]*(\s*/\s*[a-z][a-z0-9_]*)?").fullmatch
+
+# Flattened sentinel lookup: retrieving a nan value is one dict lookup on a (data_type, component, field) tuple
+# instead of a chain of four .get() calls through the nested meta data dicts.
+_NAN = float("nan")
+_NAN_VALUES = {
+    (data_type, component, field): nan
+    for data_type, components in power_grid_meta_data.items()
+    for component, meta in components.items()
+    for field, nan in meta["nans"].items()
+}
+
 
 def eval_expression(data: np.ndarray, expression: Union[int, float, str]) -> np.ndarray:
     """
@@ -40,7 +53,7 @@ def eval_expression(data: np.ndarray, expression: Union[int, float, str]) -> np.
     """
     if isinstance(expression, str):
         return eval_field_expression(data, expression)
-    return np.array(expression)
+    return np.asarray(expression)
 
 
 def eval_field_expression(data: np.ndarray, expression: str) -> np.ndarray:
@@ -67,8 +80,7 @@ def eval_field_expression(data: np.ndarray, expression: str) -> np.ndarray:
     """
 
     # Validate the expression
-    match = re.fullmatch(r"[a-z][a-z0-9_]*(\s*/\s*[a-z][a-z0-9_]*)?", expression)
-    if not match:
+    if not _field_expression_match(expression):
         raise ValueError(f"Invalid field expression '{expression}'")
 
     # Find all field names and check if they exist in the dataset
@@ -217,6 +229,9 @@ def update_input_data(input_data: Dict[str, np.ndarray], update_data: Dict[str,
                 mask = np.not_equal(array[field], nan)
             if mask.ndim == 2:
                 mask = np.any(mask, axis=1)
+            # a C-level short-circuit scan; skip the packed copy and the id matching when nothing is updated
+            if not mask.any():
+                continue
             data = array[["id", field]][mask]
             idx = np.where(merged_data[component]["id"] == np.reshape(data["id"], (-1, 1)))
             if isinstance(idx, tuple):
@@ -264,4 +279,4 @@ def nan_type(component: str, field: str, data_type="input"):
     Helper function to retrieve the nan value for a certain field as defined in the power_grid_meta_data.
     It silently returns float('nan') if data_type/component/field can't be found.
     """
-    return power_grid_meta_data.get(data_type, {}).get(component, {}).get("nans", {}).get(field, float("nan"))
+    return _NAN_VALUES.get((data_type, component, field), _NAN)
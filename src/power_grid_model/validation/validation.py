@@ -8,6 +8,8 @@ Power Grid Model Validation Functions.
 Although all functions are 'public', you probably only need validate_input_data() and validate_batch_data().
 
 """
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import chain
 from typing import Dict, List, Optional, Union
 
@@ -37,6 +39,13 @@ from .utils import InputData, UpdateData, split_update_data_in_batches, update_i
 from .. import power_grid_meta_data
 from ..enum import BranchSide, CalculationType, LoadGenType, MeasuredTerminalType, WindingType
 
+# Canonical numpy dtype per data type and component. Arrays produced by initialize_array() reference these exact
+# dtype objects, so in the common case an identity check is all that is needed to validate the dtype.
+_COMPONENT_DTYPES = {
+    data_type: {component: meta["dtype"] for component, meta in components.items()}
+    for data_type, components in power_grid_meta_data.items()
+}
+
 
 def validate_input_data(
     input_data: InputData, calculation_type: Optional[CalculationType] = None, symmetric: bool = True
@@ -141,7 +150,7 @@ def assert_valid_data_structure(data: Union[InputData, UpdateData], data_type: s
     if data_type not in {"input", "update"}:
         raise KeyError(f"Unexpected data type '{data_type}' (should be 'input' or 'update')")
 
-    component_dtype = {component: meta["dtype"] for component, meta in power_grid_meta_data[data_type].items()}
+    component_dtype = _COMPONENT_DTYPES[data_type]
     for component, array in data.items():
 
         # Check if component name is valid
@@ -151,7 +160,7 @@ def assert_valid_data_structure(data: Union[InputData, UpdateData], data_type: s
         # Check if component definition is as expected
         dtype = component_dtype[component]
         if isinstance(array, np.ndarray):
-            if array.dtype != dtype:
+            if array.dtype is not dtype and array.dtype != dtype:
                 if not hasattr(array.dtype, "names") or not array.dtype.names:
                     raise TypeError(
                         f"Unexpected Numpy array ({array.dtype}) for '{component}' {data_type}_data "
@@ -198,19 +207,9 @@ def validate_ids_exist(update_data: Dict[str, np.ndarray], input_data: InputData
     return list(chain(*errors))
 
 
-def validate_required_values(
-    data: InputData, calculation_type: Optional[CalculationType] = None, symmetric: bool = True
-) -> List[MissingValueError]:
+def _build_required_values(calculation_type: Optional[CalculationType], symmetric: bool) -> Dict[str, List[str]]:
     """
-    Checks if all required data is available.
-
-    Args:
-        data: a power-grid-model input dataset
-        calculation_type: Supply a calculation method, to allow missing values for unused fields
-        symmetric: A boolean to state whether input data will be used for a symmetric or asymmetric calculation
-
-    Returns: an empty list if all required data is available, or a list of MissingValueErrors.
-
+    Build the dictionary of required fields per component, for a given calculation type and symmetry.
     """
     # Base
     required = {"base": ["id"]}
@@ -269,12 +268,42 @@ def validate_required_values(
         required["line"] += ["r0", "x0", "c0", "tan0"]
         required["shunt"] += ["g0", "b0"]
 
+    return required
+
+
+# The required fields only depend on the calculation type and the symmetry, so all six combinations are
+# materialized once at import time; validate_required_values() then only does a single dict lookup per call.
+_REQUIRED_VALUES = {
+    (calculation_type, symmetric): _build_required_values(calculation_type, symmetric)
+    for calculation_type in (None, CalculationType.power_flow, CalculationType.state_estimation)
+    for symmetric in (True, False)
+}
+
+
+def validate_required_values(
+    data: InputData, calculation_type: Optional[CalculationType] = None, symmetric: bool = True
+) -> List[MissingValueError]:
+    """
+    Checks if all required data is available.
+
+    Args:
+        data: a power-grid-model input dataset
+        calculation_type: Supply a calculation method, to allow missing values for unused fields
+        symmetric: A boolean to state whether input data will be used for a symmetric or asymmetric calculation
+
+    Returns: an empty list if all required data is available, or a list of MissingValueErrors.
+
+    """
+    required = _REQUIRED_VALUES[(calculation_type, symmetric)]
     return list(chain(*(none_missing(data, component, required.get(component, [])) for component in data)))
 
 
 def validate_values(data: InputData) -> List[ValidationError]:  # pylint: disable=too-many-branches
     """
-    For each component supplied in the data, call the appropriate validation function
+    For each component supplied in the data, call the appropriate validation function. The components are
+    validated in parallel worker threads; the underlying numpy comparisons release the GIL. Each component
+    produces an independent list of errors, which are concatenated in the same (fixed) order as sequential
+    validation would produce them.
 
     Args:
         data: a power-grid-model input dataset
@@ -282,36 +311,38 @@ def validate_values(data: InputData) -> List[ValidationError]:  # pylint: disabl
     Returns: an empty list if all required data is valid, or a list of ValidationErrors.
 
     """
-    errors: List[ValidationError] = all_finite(data)
+    validators = [partial(all_finite, data)]
     if "node" in data:
-        errors += validate_node(data)
+        validators.append(partial(validate_node, data))
     if "line" in data:
-        errors += validate_line(data)
+        validators.append(partial(validate_line, data))
     if "link" in data:
-        errors += validate_branch(data, "link")
+        validators.append(partial(validate_branch, data, "link"))
     if "transformer" in data:
-        errors += validate_transformer(data)
+        validators.append(partial(validate_transformer, data))
     if "source" in data:
-        errors += validate_source(data)
+        validators.append(partial(validate_source, data))
     if "sym_load" in data:
-        errors += validate_generic_load_gen(data, "sym_load")
+        validators.append(partial(validate_generic_load_gen, data, "sym_load"))
     if "sym_gen" in data:
-        errors += validate_generic_load_gen(data, "sym_gen")
+        validators.append(partial(validate_generic_load_gen, data, "sym_gen"))
     if "asym_load" in data:
-        errors += validate_generic_load_gen(data, "asym_load")
+        validators.append(partial(validate_generic_load_gen, data, "asym_load"))
     if "asym_gen" in data:
-        errors += validate_generic_load_gen(data, "asym_gen")
+        validators.append(partial(validate_generic_load_gen, data, "asym_gen"))
     if "shunt" in data:
-        errors += validate_shunt(data)
+        validators.append(partial(validate_shunt, data))
     if "sym_voltage_sensor" in data:
-        errors += validate_generic_voltage_sensor(data, "sym_voltage_sensor")
+        validators.append(partial(validate_generic_voltage_sensor, data, "sym_voltage_sensor"))
     if "asym_voltage_sensor" in data:
-        errors += validate_generic_voltage_sensor(data, "asym_voltage_sensor")
+        validators.append(partial(validate_generic_voltage_sensor, data, "asym_voltage_sensor"))
     if "sym_power_sensor" in data:
-        errors += validate_generic_power_sensor(data, "sym_power_sensor")
+        validators.append(partial(validate_generic_power_sensor, data, "sym_power_sensor"))
     if "asym_power_sensor" in data:
-        errors += validate_generic_power_sensor(data, "asym_power_sensor")
-    return errors
+        validators.append(partial(validate_generic_power_sensor, data, "asym_power_sensor"))
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(lambda validate: validate(), validators))
+    return list(chain(*results))
 
 
 # pylint: disable=missing-function-docstring
@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2022 Contributors to the Power Grid Model project <dynamic.grid.calculation@alliander.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import numpy as np
+import pytest
+from power_grid_model.conversion.filters import (
+    _split_connection_string,
+    get_winding_from,
+    get_winding_from_array,
+    get_winding_to,
+    get_winding_to_array,
+    get_clock,
+    get_clock_array,
+    multiply,
+    multiply_columns,
+    value_or_default,
+    values_or_default,
+    value_or_zero,
+    complex_inverse_real_part,
+    complex_inverse_real_part_array,
+    complex_inverse_imaginary_part,
+    complex_inverse_imaginary_part_array,
+    relative_no_load_current,
+    relative_no_load_current_array,
+)
+from power_grid_model.enum import WindingType
+
+
+def test_split_connection_string():
+    assert _split_connection_string("Dyn11") == ("D", "yn", 11)
+    assert _split_connection_string("Yzn5") == ("Y", "zn", 5)
+    assert _split_connection_string("YNd0") == ("YN", "d", 0)
+    assert _split_connection_string("ZNy1") == ("ZN", "y", 1)
+    assert _split_connection_string("Dy12") == ("D", "y", 12)
+
+    with pytest.raises(ValueError, match="Dy13"):
+        _split_connection_string("Dy13")
+    with pytest.raises(ValueError, match="Xyn11"):
+        _split_connection_string("Xyn11")
+    with pytest.raises(ValueError, match="DYN11"):
+        _split_connection_string("DYN11")
+    with pytest.raises(ValueError):
+        _split_connection_string("Dyn")
+
+
+def test_get_winding_from():
+    assert get_winding_from("Yyn11") == WindingType.wye
+    assert get_winding_from("YNd11") == WindingType.wye_n
+    assert get_winding_from("Dyn11") == WindingType.delta
+    assert get_winding_from("Zy11") == WindingType.zigzag
+    assert get_winding_from("ZNy11") == WindingType.zigzag_n
+    assert get_winding_from("YNd11", neutral_grounding=False) == WindingType.wye
+    assert get_winding_from("ZNy11", neutral_grounding=False) == WindingType.zigzag
+    assert get_winding_from("Dyn11", neutral_grounding=False) == WindingType.delta
+
+
+def test_get_winding_to():
+    assert get_winding_to("Dy11") == WindingType.wye
+    assert get_winding_to("Dyn11") == WindingType.wye_n
+    assert get_winding_to("YNd11") == WindingType.delta
+    assert get_winding_to("Dz11") == WindingType.zigzag
+    assert get_winding_to("Dzn11") == WindingType.zigzag_n
+    assert get_winding_to("Dyn11", neutral_grounding=False) == WindingType.wye
+    assert get_winding_to("Dzn11", neutral_grounding=False) == WindingType.zigzag
+    assert get_winding_to("YNd11", neutral_grounding=False) == WindingType.delta
+
+
+def test_get_winding_from_array():
+    conn_str = np.array(["Dyn11", "YNd11", "Dyn11", "ZNy1"])
+    np.testing.assert_array_equal(
+        get_winding_from_array(conn_str),
+        np.array([WindingType.delta, WindingType.wye_n, WindingType.delta, WindingType.zigzag_n], dtype=np.int8),
+    )
+    np.testing.assert_array_equal(
+        get_winding_from_array(conn_str, neutral_grounding=np.array([True, False, True, False])),
+        np.array([WindingType.delta, WindingType.wye, WindingType.delta, WindingType.zigzag], dtype=np.int8),
+    )
+
+
+def test_get_winding_to_array():
+    conn_str = np.array(["Dyn11", "YNd11", "Dzn0"])
+    np.testing.assert_array_equal(
+        get_winding_to_array(conn_str),
+        np.array([WindingType.wye_n, WindingType.delta, WindingType.zigzag_n], dtype=np.int8),
+    )
+    np.testing.assert_array_equal(
+        get_winding_to_array(conn_str, neutral_grounding=False),
+        np.array([WindingType.wye, WindingType.delta, WindingType.zigzag], dtype=np.int8),
+    )
+
+
+def test_get_clock():
+    assert get_clock("YNd0") == 0
+    assert get_clock("YNd5") == 5
+    assert get_clock("YNd12") == 12
+
+
+def test_get_clock_array():
+    np.testing.assert_array_equal(
+        get_clock_array(np.array(["YNd0", "YNd5", "YNd12", "YNd5"])), np.array([0, 5, 12, 5], dtype=np.int8)
+    )
+    with pytest.raises(ValueError, match="YNd13"):
+        get_clock_array(np.array(["YNd0", "YNd13"]))
+
+
+def test_multiply():
+    assert multiply(2.0) == pytest.approx(2.0)
+    assert multiply(2.0, 3.0, 4.0) == pytest.approx(24.0)
+
+
+def test_multiply_columns():
+    np.testing.assert_array_equal(
+        multiply_columns(np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0, 6.0])),
+        np.array([15.0, 48.0]),
+    )
+    # the input columns are not modified
+    column = np.array([1.0, 2.0])
+    multiply_columns(column, np.array([3.0, 4.0]))
+    np.testing.assert_array_equal(column, np.array([1.0, 2.0]))
+
+
+def test_value_or_default():
+    assert value_or_default(1.0, 2.0) == pytest.approx(1.0)
+    assert value_or_default(0.0, 2.0) == pytest.approx(0.0)
+    assert value_or_default(None, 2.0) == pytest.approx(2.0)
+    assert value_or_default(np.nan, 2.0) == pytest.approx(2.0)
+
+
+def test_values_or_default():
+    np.testing.assert_array_equal(values_or_default(np.array([1.0, np.nan, 3.0]), 2.0), np.array([1.0, 2.0, 3.0]))
+    np.testing.assert_array_equal(values_or_default([np.nan, np.nan], 0.0), np.array([0.0, 0.0]))
+
+
+def test_value_or_zero():
+    assert value_or_zero(1.5) == pytest.approx(1.5)
+    assert value_or_zero(None) == pytest.approx(0.0)
+    assert value_or_zero(np.nan) == pytest.approx(0.0)
+
+
+def test_complex_inverse_real_part():
+    assert complex_inverse_real_part(1.0, 2.0) == pytest.approx((1.0 / (1 + 2j)).real)
+    assert complex_inverse_real_part(3.0, -1.0) == pytest.approx((1.0 / (3 - 1j)).real)
+
+
+def test_complex_inverse_imaginary_part():
+    assert complex_inverse_imaginary_part(1.0, 2.0) == pytest.approx((1.0 / (1 + 2j)).imag)
+    assert complex_inverse_imaginary_part(3.0, -1.0) == pytest.approx((1.0 / (3 - 1j)).imag)
+
+
+def test_complex_inverse_array():
+    real = np.array([1.0, 3.0, 0.0])
+    imag = np.array([2.0, -1.0, 4.0])
+    expected = 1.0 / (real + 1j * imag)
+    np.testing.assert_allclose(complex_inverse_real_part_array(real, imag), expected.real)
+    np.testing.assert_allclose(complex_inverse_imaginary_part_array(real, imag), expected.imag)
+    # plain lists are accepted as well
+    np.testing.assert_allclose(complex_inverse_real_part_array(list(real), list(imag)), expected.real)
+    np.testing.assert_allclose(complex_inverse_imaginary_part_array(list(real), list(imag)), expected.imag)
+
+
+def test_relative_no_load_current():
+    # 1000 W no load loss on a 100 kVA transformer -> 1%
+    assert relative_no_load_current(0.0, 1000.0, 100e3, 10e3) == pytest.approx(0.01)
+    # 0.2 A no load current at 10 kV on a 100 kVA transformer -> ~3.46%
+    assert relative_no_load_current(0.2, 0.0, 100e3, 10e3) == pytest.approx(0.2 / (100e3 / 10e3 / np.sqrt(3)))
+    # the highest relative value is used
+    assert relative_no_load_current(0.2, 1000.0, 100e3, 10e3) == pytest.approx(
+        max(0.01, 0.2 / (100e3 / 10e3 / np.sqrt(3)))
+    )
+    with pytest.raises(ValueError, match="100%"):
+        relative_no_load_current(100.0, 0.0, 100e3, 10e3)
+
+
+def test_relative_no_load_current_array():
+    i_0 = np.array([0.0, 0.2, 0.2])
+    p_0 = np.array([1000.0, 0.0, 1000.0])
+    s_nom = np.full(3, 100e3)
+    u_nom = np.full(3, 10e3)
+    expected = np.array([0.01, 0.2 / (100e3 / 10e3 / np.sqrt(3)), max(0.01, 0.2 / (100e3 / 10e3 / np.sqrt(3)))])
+    np.testing.assert_allclose(relative_no_load_current_array(i_0, p_0, s_nom, u_nom), expected)
+    # plain lists are accepted as well
+    np.testing.assert_allclose(relative_no_load_current_array(list(i_0), list(p_0), list(s_nom), list(u_nom)), expected)
+    with pytest.raises(ValueError, match="100%"):
+        relative_no_load_current_array(np.array([0.0, 100.0]), np.zeros(2), np.full(2, 100e3), np.full(2, 10e3))
@@ -15,6 +15,8 @@ def test_initialize_array():
     arr = initialize_array("input", "node", 3)
     assert arr.shape == (3,)
     assert np.all(np.isnan(arr["u_rated"]))
+    # the dtype is the exact object from the meta data, so it can be validated by identity
+    assert arr.dtype is power_grid_meta_data["input"]["node"]["dtype"]
     arr_2d = initialize_array("input", "node", (2, 3))
     assert arr_2d.shape == (2, 3)
     assert np.all(np.isnan(arr_2d["u_rated"]))